@@ -6,12 +6,50 @@ Framework for systematic evaluation of LLM performance on sports analytics
 
 import pandas as pd
 import numpy as np
+import copy
+import functools
 import json
+import os
+import sys
+import time
+from collections import Counter
 from datetime import datetime
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Set, Tuple, Any, Callable
 import logging
 import re
 
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib encoder
+    orjson = None
+
+
+# Patterns used on every validate_response call, compiled once
+# One token per integer/decimal, with an optional trailing "%" (e.g. "60.9 %")
+_TOKEN_RE = re.compile(r'\b(?P<num>\d+(?:\.\d+)?)\b(?P<pct>\s*%)?')
+_HAS_DIGIT_RE = re.compile(r'\d')
+
+# (values, percent values, integers) as returned by _extract_numbers
+_Numbers = Tuple[List[float], List[float], Set[int]]
+
+
+def _compile_alternation(terms) -> re.Pattern:
+    """Compile literal terms into one pattern that scans a text once for all of them.
+
+    The alternation sits inside a lookahead, so findall() reports a term at
+    every position it starts, including where it overlaps another term.
+    """
+    alternation = '|'.join(
+        re.escape(t) for t in sorted(terms, key=len, reverse=True))
+    return re.compile(f'(?=({alternation}))')
+
+
+def _format_timestamp_ns(ns: int) -> str:
+    """Format a time.time_ns() value as a local ISO-8601 timestamp"""
+    seconds, remainder = divmod(ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(
+        microsecond=remainder // 1000).isoformat()
+
 
 class ResultsAnalyzer:
     """Analyze and summarize LLM testing results"""
@@ -23,7 +61,7 @@ class ResultsAnalyzer:
                    validation_result: Dict[str, Any]):
         """Add a test result"""
         self.results.append({
-            'timestamp': datetime.now().isoformat(),
+            'timestamp_ns': time.time_ns(),  # formatted lazily on export
             'prompt_type': prompt_type,
             'question': question,
             'llm_response': llm_response,
@@ -35,134 +73,182 @@ class ResultsAnalyzer:
         if not self.results:
             return "No results to analyze."
 
-        # Calculate success rates by type
-        type_stats = {}
+        # Tally success rates by type, example successes and error types
+        # in a single pass over the results
+        type_total = Counter()
+        type_accurate = Counter()
+        error_types = Counter()
+        accurate_examples = []
         for result in self.results:
             ptype = result['prompt_type']
-            if ptype not in type_stats:
-                type_stats[ptype] = {'total': 0, 'accurate': 0}
-
-            type_stats[ptype]['total'] += 1
+            type_total[ptype] += 1
             if result['validation'].get('accuracy', False):
-                type_stats[ptype]['accurate'] += 1
+                type_accurate[ptype] += 1
+                if len(accurate_examples) < 3:  # Top 3 examples
+                    accurate_examples.append(result)
+            else:
+                error_types[result['validation'].get(
+                    'error_type', 'unknown')] += 1
 
-        report = "# LLM Testing Summary Report\n\n"
-        report += f"**Total Tests Conducted:** {len(self.results)}\n"
-        report += f"**Test Date:** {datetime.now().strftime('%Y-%m-%d')}\n\n"
+        parts = ["# LLM Testing Summary Report\n\n"]
+        parts.append(f"**Total Tests Conducted:** {len(self.results)}\n")
+        parts.append(
+            f"**Test Date:** {datetime.now().strftime('%Y-%m-%d')}\n\n")
 
-        report += "## Success Rates by Question Type\n\n"
-        for ptype, stats in type_stats.items():
-            success_rate = (stats['accurate'] / stats['total']
-                            ) * 100 if stats['total'] else 0.0
-            report += f"- **{ptype.title()}**: {success_rate:.1f}% ({stats['accurate']}/{stats['total']})\n"
+        parts.append("## Success Rates by Question Type\n\n")
+        for ptype, total in type_total.items():
+            accurate = type_accurate[ptype]
+            success_rate = (accurate / total) * 100 if total else 0.0
+            parts.append(
+                f"- **{ptype.title()}**: {success_rate:.1f}% ({accurate}/{total})\n")
 
-        report += "\n## Key Findings\n\n"
+        parts.append("\n## Key Findings\n\n")
 
         # Identify patterns
-        accurate_results = [
-            r for r in self.results if r['validation'].get('accuracy', False)]
-        inaccurate_results = [
-            r for r in self.results if not r['validation'].get('accuracy', False)]
-
-        if accurate_results:
-            report += "### Successful Patterns\n"
-            for result in accurate_results[:3]:  # Top 3 examples
-                report += f"- {result['question']}: Success\n"
-
-        if inaccurate_results:
-            report += "\n### Common Errors\n"
-            error_types = {}
-            for result in inaccurate_results:
-                error_type = result['validation'].get('error_type', 'unknown')
-                error_types[error_type] = error_types.get(error_type, 0) + 1
+        if accurate_examples:
+            parts.append("### Successful Patterns\n")
+            for result in accurate_examples:
+                parts.append(f"- {result['question']}: Success\n")
 
+        if error_types:
+            parts.append("\n### Common Errors\n")
             for error, count in error_types.items():
-                report += f"- {error.replace('_', ' ').title()}: {count} occurrences\n"
+                parts.append(
+                    f"- {error.replace('_', ' ').title()}: {count} occurrences\n")
 
-        return report
+        return "".join(parts)
 
     def export_results(self, filename: str):
         """Export results to JSON file"""
-        with open(filename, 'w') as f:
-            json.dump(self.results, f, indent=2)
+        records = [
+            {'timestamp': _format_timestamp_ns(r['timestamp_ns']),
+             **{k: v for k, v in r.items() if k != 'timestamp_ns'}}
+            for r in self.results
+        ]
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(
+                    records,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(records, f, indent=2)
         print(f"Results exported to {filename}")
 
 
+_DATASET_CSV = 'syracuse_lacrosse_2024_real.csv'
+
+# Syracuse Women's Lacrosse 2024 Player Statistics
+# Data collected from official team scorebook. Columns are fixed-dtype
+# arrays so DataFrame construction needs no per-element type inference.
+_PLAYERS = np.array([
+    'Meaghan Tyrrell', 'Olivia Adamson', 'Emma Ward', 'Sam Swart',
+    'Payton Rowley', 'Maddy Baxter', 'Savannah Sweitzer', 'Emma Madnick',
+    'Jody Cerullo', 'Grace Britton', 'Kendall Rose', 'Kaci Benoit',
+    'Sloane Clark', 'Katie Goodale', 'Mackenzie Rich', 'Victoria Reid',
+    'Ryann Banks', 'Hallie Simpkins', 'McKenzie Oleen', 'Ruby Hnatkowiak',
+    'Sydney Pirreca', 'Carlie Desimone', 'Ally Quirk', 'Tate Paulson',
+    'Ryan Johnson', 'Georgia Sexton-Stone', 'Gwenna Gento', 'Ezra Lahan',
+    'Ella Bree', 'Talia Waders', 'Jenna Marino', 'Ana Horvit',
+    'Delaney Swartout', 'Daniella Guyette'
+], dtype=object)
+_JERSEY = np.array([
+    22, 22, 23, 2, 19, 22, 21, 22,
+    17, 19, 7, 22, 9, 31, 10, 7,
+    4, 22, 21, 22, 6, 9, 5, 1,
+    6, 7, 7, 7, 6, 5, 3, 7,
+    22, 7
+], dtype=np.int32)
+_GOALS = np.array([
+    70, 58, 44, 29, 23, 30, 24, 14,
+    11, 6, 8, 1, 1, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0
+], dtype=np.int32)
+_ASSISTS = np.array([
+    32, 25, 37, 18, 15, 6, 9, 13,
+    3, 4, 1, 0, 0, 1, 1, 0,
+    1, 1, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0
+], dtype=np.int32)
+_POINTS = np.array([
+    102, 83, 81, 47, 38, 36, 33, 27,
+    14, 10, 9, 1, 1, 1, 1, 0,
+    1, 1, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0
+], dtype=np.int32)
+_SHOTS = np.array([
+    115, 109, 90, 53, 55, 64, 54, 42,
+    29, 17, 11, 3, 1, 2, 1, 2,
+    1, 0, 4, 2, 1, 1, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0
+], dtype=np.int32)
+_GAMES_PLAYED = np.array([
+    21, 12, 10, 19, 15, 14, 8, 15,
+    10, 3, 3, 21, 1, 43, 19, 19,
+    0, 26, 3, 1, 10, 0, 0, 1,
+    0, 0, 0, 1, 1, 0, 0, 0,
+    4, 0
+], dtype=np.int32)
+
+# Concrete coaching verbs/ideas that count towards strategic actionability
+_ACTION_TERMS = (
+    'focus', 'improve', 'increase', 'reduce', 'practice', 'drill', 'scheme',
+    'set play', 'assign', 'rotate', 'substitute', 'optimize', 'work on',
+    'emphasize', 'target', 'adjust', 'press', 'zone', 'man-to-man', 'transition'
+)
+
+# One scan per response finds every player named in it
+_NAME_RE = _compile_alternation(
+    str(n).lower() for n in _PLAYERS if str(n).strip())
+_ACTION_RE = _compile_alternation(_ACTION_TERMS)
+
+
+def _safe_div(num, den):
+    """Element-wise num / den, with 0.0 wherever den is not positive"""
+    return np.divide(num, den, out=np.zeros(len(num)), where=den > 0)
+
+
 def create_syracuse_2024_dataset():
-    """Create Syracuse Women's Lacrosse 2024 dataset from official statistics"""
+    """Create Syracuse Women's Lacrosse 2024 dataset from official statistics
+
+    Returns fresh copies of the cached dataset, so callers may modify them.
+    """
+    df, team_stats = _build_syracuse_2024_dataset()
+    return df.copy(), dict(team_stats)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_syracuse_2024_dataset():
+    """Build the dataset once; the cached objects are shared and never handed out"""
 
-    # Syracuse Women's Lacrosse 2024 Player Statistics
-    # Data collected from official team scorebook
     syracuse_players = {
-        'Player': [
-            'Meaghan Tyrrell', 'Olivia Adamson', 'Emma Ward', 'Sam Swart',
-            'Payton Rowley', 'Maddy Baxter', 'Savannah Sweitzer', 'Emma Madnick',
-            'Jody Cerullo', 'Grace Britton', 'Kendall Rose', 'Kaci Benoit',
-            'Sloane Clark', 'Katie Goodale', 'Mackenzie Rich', 'Victoria Reid',
-            'Ryann Banks', 'Hallie Simpkins', 'McKenzie Oleen', 'Ruby Hnatkowiak',
-            'Sydney Pirreca', 'Carlie Desimone', 'Ally Quirk', 'Tate Paulson',
-            'Ryan Johnson', 'Georgia Sexton-Stone', 'Gwenna Gento', 'Ezra Lahan',
-            'Ella Bree', 'Talia Waders', 'Jenna Marino', 'Ana Horvit',
-            'Delaney Swartout', 'Daniella Guyette'
-        ],
-        'Jersey': [
-            22, 22, 23, 2, 19, 22, 21, 22,
-            17, 19, 7, 22, 9, 31, 10, 7,
-            4, 22, 21, 22, 6, 9, 5, 1,
-            6, 7, 7, 7, 6, 5, 3, 7,
-            22, 7
-        ],
-        'Goals': [
-            70, 58, 44, 29, 23, 30, 24, 14,
-            11, 6, 8, 1, 1, 0, 0, 0,
-            0, 0, 0, 0, 0, 0, 0, 0,
-            0, 0, 0, 0, 0, 0, 0, 0,
-            0, 0
-        ],
-        'Assists': [
-            32, 25, 37, 18, 15, 6, 9, 13,
-            3, 4, 1, 0, 0, 1, 1, 0,
-            1, 1, 0, 0, 0, 0, 0, 0,
-            0, 0, 0, 0, 0, 0, 0, 0,
-            0, 0
-        ],
-        'Points': [
-            102, 83, 81, 47, 38, 36, 33, 27,
-            14, 10, 9, 1, 1, 1, 1, 0,
-            1, 1, 0, 0, 0, 0, 0, 0,
-            0, 0, 0, 0, 0, 0, 0, 0,
-            0, 0
-        ],
-        'Shots': [
-            115, 109, 90, 53, 55, 64, 54, 42,
-            29, 17, 11, 3, 1, 2, 1, 2,
-            1, 0, 4, 2, 1, 1, 0, 0,
-            0, 0, 0, 0, 0, 0, 0, 0,
-            0, 0
-        ],
-        'Games_Played': [
-            21, 12, 10, 19, 15, 14, 8, 15,
-            10, 3, 3, 21, 1, 43, 19, 19,
-            0, 26, 3, 1, 10, 0, 0, 1,
-            0, 0, 0, 1, 1, 0, 0, 0,
-            4, 0
-        ]
+        'Player': _PLAYERS,
+        'Jersey': _JERSEY,
+        'Goals': _GOALS,
+        'Assists': _ASSISTS,
+        'Points': _POINTS,
+        'Shots': _SHOTS,
+        'Games_Played': _GAMES_PLAYED
     }
 
     # Create DataFrame
     df = pd.DataFrame(syracuse_players)
 
-    # Calculate additional statistics
-    df['Shooting_Pct'] = np.where(
-        df['Shots'] > 0, (df['Goals'] / df['Shots']) * 100, 0.0)
-    df['Goals_Per_Game'] = np.where(
-        df['Games_Played'] > 0, df['Goals'] / df['Games_Played'], 0.0)
-    df['Points_Per_Game'] = np.where(
-        df['Games_Played'] > 0, df['Points'] / df['Games_Played'], 0.0)
+    # Calculate additional statistics on the raw NumPy arrays; at 34 rows the
+    # per-call overhead of pandas Series arithmetic dominates the work
+    df['Shooting_Pct'] = _safe_div(_GOALS, _SHOTS) * 100
+    df['Goals_Per_Game'] = _safe_div(_GOALS, _GAMES_PLAYED)
+    df['Points_Per_Game'] = _safe_div(_POINTS, _GAMES_PLAYED)
 
-    # Derive team-level statistics from the DataFrame to avoid mismatch
-    total_goals = int(df['Goals'].sum())
-    total_assists = int(df['Assists'].sum())
+    # Derive team-level statistics from the same data to avoid mismatch
+    total_goals = int(_GOALS.sum())
+    total_assists = int(_ASSISTS.sum())
+    total_shots = int(_SHOTS.sum())
 
     team_stats = {
         'season_record': '16-6',
@@ -174,8 +260,8 @@ def create_syracuse_2024_dataset():
         'non_conference_record': '7-5',
         'total_team_goals': total_goals,     # derived
         'total_team_assists': total_assists,  # derived
-        'team_shots': int(df['Shots'].sum()),
-        'team_shot_pct': round((total_goals / max(1, int(df['Shots'].sum()))) * 100, 2) if int(df['Shots'].sum()) > 0 else 0,
+        'team_shots': total_shots,
+        'team_shot_pct': round((total_goals / total_shots) * 100, 2) if total_shots > 0 else 0,
         # keep these as placeholders if you need them; otherwise compute properly from game logs
         'goals_per_game': None,
         'goals_against_per_game': None
@@ -184,74 +270,109 @@ def create_syracuse_2024_dataset():
     return df, team_stats
 
 
+def _compute_ground_truth(df: pd.DataFrame, team_stats: Dict[str, Any]) -> Dict[str, Any]:
+    """Calculate known statistics from Syracuse data for validation"""
+    stats = {}
+
+    # Team-level statistics
+    stats['total_games'] = team_stats['total_games']
+    stats['season_record'] = team_stats['season_record']
+    stats['wins'] = 16
+    stats['losses'] = 6
+
+    # Read each column once and derive every scalar from the same arrays,
+    # rather than re-dispatching idxmax/max/sum through pandas per statistic
+    players = df['Player'].to_numpy()
+    goals = df['Goals'].to_numpy()
+    assists = df['Assists'].to_numpy()
+    points = df['Points'].to_numpy()
+
+    # Top performers
+    top_g, top_a, top_p = int(goals.argmax()), int(assists.argmax()), int(points.argmax())
+    stats['top_scorer'] = players[top_g]
+    stats['top_scorer_goals'] = int(goals[top_g])
+
+    stats['top_assist'] = players[top_a]
+    stats['top_assist_count'] = int(assists[top_a])
+
+    stats['top_points'] = players[top_p]
+    stats['top_points_count'] = int(points[top_p])
+
+    # Team totals
+    stats['total_goals'] = int(goals.sum())
+    stats['total_assists'] = int(assists.sum())
+    stats['total_points'] = int(points.sum())
+
+    # Shooting statistics (minimum 10 shots for qualification)
+    qualified_shooters = df[df['Shots'] >= 10]
+    if not qualified_shooters.empty:
+        best_shooter_idx = qualified_shooters['Shooting_Pct'].idxmax()
+        stats['best_shooter'] = str(
+            qualified_shooters.loc[best_shooter_idx, 'Player'])
+        stats['best_shooting_pct'] = float(
+            qualified_shooters.loc[best_shooter_idx, 'Shooting_Pct'])
+
+    # Active scorers (players with at least 5 goals)
+    stats['active_scorers'] = int(np.count_nonzero(goals >= 5))
+
+    # Intermediate ground truth
+    top3 = df.nlargest(3, 'Goals')
+    top3_pct = _safe_div(top3['Goals'].to_numpy(),
+                         top3['Shots'].to_numpy()) * 100.0
+    stats['top3_shooting'] = [
+        {'player': str(player), 'shooting_pct': round(float(pct), 1)}
+        for player, pct in zip(top3['Player'].to_numpy(), top3_pct)
+    ]
+    stats['count_ge_10_goals'] = int(np.count_nonzero(goals >= 10))
+
+    return stats
+
+
+# Ground truth depends only on the fixed dataset, so compute it once at import
+_GROUND_TRUTH = _compute_ground_truth(*_build_syracuse_2024_dataset())
+
+
 class SyracuseDataValidator:
     """Validates LLM responses against real Syracuse Women's Lacrosse 2024 statistics"""
 
     def __init__(self):
         """Initialize with real Syracuse 2024 data"""
         self.df, self.team_stats = create_syracuse_2024_dataset()
-        self.ground_truth = self._calculate_ground_truth()
-
-        # Save the dataset for reference
-        self.df.to_csv('syracuse_lacrosse_2024_real.csv', index=False)
-        print("Syracuse 2024 data saved to syracuse_lacrosse_2024_real.csv")
-
-    def _calculate_ground_truth(self) -> Dict[str, Any]:
-        """Calculate known statistics from Syracuse data for validation"""
-        stats = {}
-
-        # Team-level statistics
-        stats['total_games'] = self.team_stats['total_games']
-        stats['season_record'] = self.team_stats['season_record']
-        stats['wins'] = 16
-        stats['losses'] = 6
-
-        # Top performers
-        stats['top_scorer'] = self.df.loc[self.df['Goals'].idxmax(), 'Player']
-        stats['top_scorer_goals'] = int(self.df['Goals'].max())
-
-        stats['top_assist'] = self.df.loc[self.df['Assists'].idxmax(),
-                                          'Player']
-        stats['top_assist_count'] = int(self.df['Assists'].max())
-
-        stats['top_points'] = self.df.loc[self.df['Points'].idxmax(), 'Player']
-        stats['top_points_count'] = int(self.df['Points'].max())
-
-        # Team totals
-        stats['total_goals'] = int(self.df['Goals'].sum())
-        stats['total_assists'] = int(self.df['Assists'].sum())
-        stats['total_points'] = int(self.df['Points'].sum())
-
-        # Shooting statistics (minimum 10 shots for qualification)
-        qualified_shooters = self.df[self.df['Shots'] >= 10].copy()
-        if not qualified_shooters.empty:
-            best_shooter_idx = qualified_shooters['Shooting_Pct'].idxmax()
-            stats['best_shooter'] = str(
-                qualified_shooters.loc[best_shooter_idx, 'Player'])
-            stats['best_shooting_pct'] = float(
-                qualified_shooters.loc[best_shooter_idx, 'Shooting_Pct'])
-
-        # Active scorers (players with at least 5 goals)
-        stats['active_scorers'] = int((self.df['Goals'] >= 5).sum())
-
-        # Intermediate ground truth
-        top3 = self.df.sort_values('Goals', ascending=False).head(3).copy()
-        top3['Shooting_Pct_calc'] = np.where(
-            top3['Shots'] > 0, (top3['Goals'] / top3['Shots']) * 100.0, 0.0
-        )
-        stats['top3_shooting'] = [
-            {
-                'player': str(row['Player']),
-                'shooting_pct': round(float(row['Shooting_Pct_calc']), 1)
-            }
-            for _, row in top3.iterrows()
-        ]
-        stats['count_ge_10_goals'] = int((self.df['Goals'] >= 10).sum())
+        self.ground_truth = copy.deepcopy(_GROUND_TRUTH)
+
+        # Lowercased lookups reused by every response that gets scored
+        self._top_scorer_lower = str(self.ground_truth['top_scorer']).lower()
+        self._top_assist_lower = str(self.ground_truth['top_assist']).lower()
+        self._expected_shooting = {
+            d['player'].lower(): float(d['shooting_pct'])
+            for d in self.ground_truth['top3_shooting']}
+        self._context = None
+
+        # question_type -> validator; unknown types leave the result unscored
+        self._handlers = {
+            'season_record': self._validate_season_record,
+            'total_games': self._validate_total_games,
+            'top_scorer': self._validate_top_scorer,
+            'team_goals': self._validate_team_goals,
+            'top_assists': self._validate_top_assists,
+            'shooting_analysis': self._validate_shooting_analysis,
+            'offensive_balance': self._validate_offensive_balance,
+            'strategic_analysis': self._validate_strategic_analysis,
+        }
 
-        return stats
+        # Save the dataset for reference (only once; the data never changes)
+        if not os.path.exists(_DATASET_CSV):
+            self.df.to_csv(_DATASET_CSV, index=False)
+            print(f"Syracuse 2024 data saved to {_DATASET_CSV}")
 
     def get_testing_context(self) -> str:
-        """Get formatted data context for LLM testing"""
+        """Get formatted data context for LLM testing (built once, then cached)"""
+        if self._context is None:
+            self._context = self._build_testing_context()
+        return self._context
+
+    def _build_testing_context(self) -> str:
+        """Format the team record, top scorers and team totals as LLM context"""
         context = f"""
 Syracuse Women's Lacrosse 2024 Season Statistics:
 
@@ -264,14 +385,15 @@ TOP PERFORMERS:
 """
 
         # Get top 10 scorers for context
-        top_scorers = self.df.nlargest(
-            10, 'Goals')[['Player', 'Goals', 'Assists', 'Points', 'Shots', 'Games_Played']]
-
-        for _, player in top_scorers.iterrows():
-            if player['Goals'] > 0:  # Only include actual contributors
-                shooting_pct = (
-                    player['Goals'] / player['Shots'] * 100.0) if player['Shots'] > 0 else 0.0
-                context += f"- {player['Player']}: {int(player['Goals'])}G, {int(player['Assists'])}A, {int(player['Points'])}Pts, {int(player['Shots'])} shots ({shooting_pct:.1f}%)\n"
+        top_scorers = self.df.nlargest(10, 'Goals')
+        columns = (top_scorers[c].to_numpy()
+                   for c in ('Player', 'Goals', 'Assists', 'Points', 'Shots'))
+        lines = [
+            f"- {p}: {int(g)}G, {int(a)}A, {int(pts)}Pts, {int(s)} shots ({(g / s * 100.0) if s > 0 else 0.0:.1f}%)\n"
+            for p, g, a, pts, s in zip(*columns)
+            if g > 0  # Only include actual contributors
+        ]
+        context += "".join(lines)
 
         # Always use DataFrame-derived totals to avoid mismatch
         team_goals = int(self.df['Goals'].sum())
@@ -281,43 +403,43 @@ TOP PERFORMERS:
         return context
 
     # ---------- NEW HELPERS FOR PART 2 ----------
-    def _extract_numbers_and_percents(self, text: str) -> Tuple[List[float], List[float]]:
-        """Extract numeric values (ints/decimals) and percentages from text."""
-        # integers and decimals
-        nums = re.findall(r'\b\d+(?:\.\d+)?\b', text)
-        # tokens like "60.9%" or "60.9 %"
-        pcts = re.findall(r'\b\d+(?:\.\d+)?\s*%', text)
-        pct_vals = [float(p.rstrip('%').strip()) for p in pcts]
-        vals = [float(n) for n in nums]
-        return vals, pct_vals
+    def _extract_numbers(self, text: str) -> _Numbers:
+        """Extract numeric values, percentages and integers from text in one pass.
+
+        Returns (values, percent values, integers). The integers are a set,
+        since they are only used for membership checks; a decimal such as
+        "60.9" contributes both of its digit runs (60 and 9), matching the
+        legacy integer-only extraction.
+        """
+        vals, pct_vals, ints = [], [], set()
+        for m in _TOKEN_RE.finditer(text):
+            num = m['num']
+            value = float(num)
+            vals.append(value)
+            if m['pct']:
+                pct_vals.append(value)
+            ints.update(int(part) for part in num.split('.'))
+        return vals, pct_vals, ints
 
     def _score_strategic_response(self, text: str) -> Dict[str, int]:
         """Score a free-form strategic response using a simple rubric."""
         text_l = text.lower()
 
         # Specificity: mentions real players and numbers
-        names = [str(n).lower()
-                 for n in self.df['Player'].tolist() if str(n).strip()]
-        mentions = sum(1 for n in names if n in text_l)
-        contains_numbers = bool(re.search(r'\d', text_l))
+        mentions = len(set(_NAME_RE.findall(text_l)))
+        contains_numbers = bool(_HAS_DIGIT_RE.search(text_l))
         specificity = 1 + min(4, mentions // 2) + \
             (1 if contains_numbers else 0)
         specificity = min(5, specificity)
 
         # Actionability: presence of concrete coaching verbs/ideas
-        action_terms = [
-            'focus', 'improve', 'increase', 'reduce', 'practice', 'drill', 'scheme',
-            'set play', 'assign', 'rotate', 'substitute', 'optimize', 'work on',
-            'emphasize', 'target', 'adjust', 'press', 'zone', 'man-to-man', 'transition'
-        ]
-        actionability = 1 + sum(1 for t in action_terms if t in text_l)
+        actionability = 1 + len(set(_ACTION_RE.findall(text_l)))
         actionability = max(1, min(5, actionability))
 
         # Plausibility: no contradictions to key stats (e.g., wrong top scorer)
         plausible = True
-        top_scorer = str(self.ground_truth['top_scorer']).lower()
         # If they explicitly claim a different top scorer, penalize
-        if ('top scorer' in text_l or 'leading scorer' in text_l) and (top_scorer not in text_l):
+        if ('top scorer' in text_l or 'leading scorer' in text_l) and (self._top_scorer_lower not in text_l):
             plausible = False
         plausibility = 5 if plausible else 2
 
@@ -336,136 +458,150 @@ TOP PERFORMERS:
             'llm_answer': llm_response[:100] + "..." if len(llm_response) > 100 else llm_response
         }
 
-        # for legacy integer-only checks
-        legacy_ints = self._extract_numbers_legacy(llm_response)
         response_lower = llm_response.lower()
-
-        if question_type == 'season_record':
-            expected = self.ground_truth['season_record']
-            result['expected_answer'] = expected
-            if expected in llm_response or f"{self.ground_truth['wins']}-{self.ground_truth['losses']}" in llm_response:
-                result['accuracy'] = True
-            else:
-                result['error_type'] = 'incorrect_record'
-                result['notes'].append(f"Expected {expected}")
-
-        elif question_type == 'total_games':
-            expected = self.ground_truth['total_games']
-            result['expected_answer'] = expected
-            if legacy_ints and expected in legacy_ints:
-                result['accuracy'] = True
-            else:
-                result['error_type'] = 'incorrect_calculation'
-                result['notes'].append(
-                    f"Expected {expected}, found numbers: {legacy_ints}")
-
-        elif question_type == 'top_scorer':
-            expected_player = self.ground_truth['top_scorer']
-            expected_goals = self.ground_truth['top_scorer_goals']
-            result['expected_answer'] = f"{expected_player} ({expected_goals} goals)"
-
-            if expected_player.lower() in response_lower:
-                result['accuracy'] = True
-                if expected_goals in legacy_ints:
-                    result['notes'].append("Correctly included goal count")
-            else:
-                result['error_type'] = 'incorrect_player'
-                result['notes'].append(f"Expected {expected_player}")
-
-        elif question_type == 'team_goals':
-            expected = self.ground_truth['total_goals']
-            result['expected_answer'] = expected
-            if legacy_ints and expected in legacy_ints:
-                result['accuracy'] = True
-            else:
-                result['error_type'] = 'incorrect_calculation'
-                result['notes'].append(
-                    f"Expected {expected}, found: {legacy_ints}")
-
-        elif question_type == 'top_assists':
-            expected_player = self.ground_truth['top_assist']
-            expected_count = self.ground_truth['top_assist_count']
-            result['expected_answer'] = f"{expected_player} ({expected_count} assists)"
-
-            if expected_player.lower() in response_lower:
-                result['accuracy'] = True
-            else:
-                result['error_type'] = 'incorrect_player'
-                result['notes'].append(f"Expected {expected_player}")
-
-        # ---------- NEW VALIDATORS FOR PART 2 ----------
-        elif question_type == 'shooting_analysis':
-            # expected: top 3 goal scorers' shooting % (rounded 1-dec), match by name with tolerance
-            expected = [(d['player'].lower(), d['shooting_pct'])
-                        for d in self.ground_truth['top3_shooting']]
-            result['expected_answer'] = self.ground_truth['top3_shooting']
-
-            vals, pcts = self._extract_numbers_and_percents(llm_response)
-            candidates = pcts + vals  # allow either "60.9%" or 60.9 (no %)
-            tol = 0.5
-            hits = 0
-            for name, pct in expected:
-                if name in response_lower:
-                    if any(abs(float(x) - float(pct)) <= tol for x in candidates):
-                        hits += 1
-            # require at least 2 of 3 correct to pass
-            result['accuracy'] = (hits >= 2)
-            if not result['accuracy']:
-                result['error_type'] = 'incorrect_shooting_analysis'
-                result['notes'].append(
-                    f"Matched {hits}/3 expected player% entries (±{tol})")
-
-        elif question_type == 'offensive_balance':
-            # expected: number of players with >= 10 goals
-            count_ge_10 = self.ground_truth['count_ge_10_goals']
-            result['expected_answer'] = count_ge_10
-            vals, _ = self._extract_numbers_and_percents(llm_response)
-            # accept if any integer-rounded value equals expected
-            ok = any(int(round(v)) == int(count_ge_10) for v in vals)
-            result['accuracy'] = ok
-            if not ok:
-                result['error_type'] = 'incorrect_offensive_depth'
-                result['notes'].append(
-                    f"Expected {count_ge_10}, found: {vals}")
-
-        elif question_type == 'strategic_analysis':
-            # rubric-based evaluation
-            scores = self._score_strategic_response(llm_response)
-            result['expected_answer'] = 'Rubric-based (Specificity, Actionability, Plausibility >= 3)'
-            result['notes'].append(f"Scores: {scores}")
-            result['accuracy'] = (scores['specificity'] >= 3 and
-                                  scores['actionability'] >= 3 and
-                                  scores['plausibility'] >= 3)
-            if not result['accuracy']:
-                result['error_type'] = 'insufficient_rubric_scores'
-        # ------------------------------------------------
+        handler = self._handlers.get(question_type)
+        if handler is not None:
+            # numbers are only extracted by the handlers that need them
+            handler(result, llm_response, response_lower,
+                    functools.partial(self._extract_numbers, llm_response))
 
         return result
 
-    def _extract_numbers_legacy(self, text: str) -> List[int]:
-        """Extract integer values from text (legacy helper kept for basic checks)."""
-        numbers = re.findall(r'\b\d+\b', text)
-        return [int(n) for n in numbers]
+    def _validate_season_record(self, result: Dict[str, Any], llm_response: str,
+                                response_lower: str, numbers: Callable[[], _Numbers]):
+        """Season record must appear verbatim (e.g. "16-6")"""
+        expected = self.ground_truth['season_record']
+        result['expected_answer'] = expected
+        if expected in llm_response or f"{self.ground_truth['wins']}-{self.ground_truth['losses']}" in llm_response:
+            result['accuracy'] = True
+        else:
+            result['error_type'] = 'incorrect_record'
+            result['notes'].append(f"Expected {expected}")
+
+    def _validate_total_games(self, result: Dict[str, Any], llm_response: str,
+                              response_lower: str, numbers: Callable[[], _Numbers]):
+        """Total games must appear among the integers in the response"""
+        _, _, ints = numbers()
+        expected = self.ground_truth['total_games']
+        result['expected_answer'] = expected
+        if expected in ints:
+            result['accuracy'] = True
+        else:
+            result['error_type'] = 'incorrect_calculation'
+            result['notes'].append(
+                f"Expected {expected}, found numbers: {sorted(ints)}")
+
+    def _validate_top_scorer(self, result: Dict[str, Any], llm_response: str,
+                             response_lower: str, numbers: Callable[[], _Numbers]):
+        """Top scorer must be named; the goal count is noted if present"""
+        expected_player = self.ground_truth['top_scorer']
+        expected_goals = self.ground_truth['top_scorer_goals']
+        result['expected_answer'] = f"{expected_player} ({expected_goals} goals)"
+
+        if self._top_scorer_lower in response_lower:
+            result['accuracy'] = True
+            _, _, ints = numbers()
+            if expected_goals in ints:
+                result['notes'].append("Correctly included goal count")
+        else:
+            result['error_type'] = 'incorrect_player'
+            result['notes'].append(f"Expected {expected_player}")
+
+    def _validate_team_goals(self, result: Dict[str, Any], llm_response: str,
+                             response_lower: str, numbers: Callable[[], _Numbers]):
+        """Team goal total must appear among the integers in the response"""
+        _, _, ints = numbers()
+        expected = self.ground_truth['total_goals']
+        result['expected_answer'] = expected
+        if expected in ints:
+            result['accuracy'] = True
+        else:
+            result['error_type'] = 'incorrect_calculation'
+            result['notes'].append(
+                f"Expected {expected}, found: {sorted(ints)}")
+
+    def _validate_top_assists(self, result: Dict[str, Any], llm_response: str,
+                              response_lower: str, numbers: Callable[[], _Numbers]):
+        """Top assist leader must be named"""
+        expected_player = self.ground_truth['top_assist']
+        expected_count = self.ground_truth['top_assist_count']
+        result['expected_answer'] = f"{expected_player} ({expected_count} assists)"
+
+        if self._top_assist_lower in response_lower:
+            result['accuracy'] = True
+        else:
+            result['error_type'] = 'incorrect_player'
+            result['notes'].append(f"Expected {expected_player}")
+
+    # ---------- NEW VALIDATORS FOR PART 2 ----------
+    def _validate_shooting_analysis(self, result: Dict[str, Any], llm_response: str,
+                                    response_lower: str, numbers: Callable[[], _Numbers]):
+        """At least 2 of the top-3 scorers named with shooting % within tolerance"""
+        vals, pcts, _ = numbers()
+        # expected: top 3 goal scorers' shooting % (rounded 1-dec), match by name with tolerance
+        result['expected_answer'] = self.ground_truth['top3_shooting']
+
+        candidates = pcts + vals  # allow either "60.9%" or 60.9 (no %)
+        tol = 0.5
+        hits = 0
+        # one scan finds every player named; expected ones are dict lookups
+        for name in set(_NAME_RE.findall(response_lower)):
+            pct = self._expected_shooting.get(name)
+            if pct is not None and any(abs(x - pct) <= tol for x in candidates):
+                hits += 1
+        # require at least 2 of 3 correct to pass
+        result['accuracy'] = (hits >= 2)
+        if not result['accuracy']:
+            result['error_type'] = 'incorrect_shooting_analysis'
+            result['notes'].append(
+                f"Matched {hits}/3 expected player% entries (±{tol})")
+
+    def _validate_offensive_balance(self, result: Dict[str, Any], llm_response: str,
+                                    response_lower: str, numbers: Callable[[], _Numbers]):
+        """Number of players with 10+ goals must appear in the response"""
+        vals, _, _ = numbers()
+        # expected: number of players with >= 10 goals
+        count_ge_10 = self.ground_truth['count_ge_10_goals']
+        result['expected_answer'] = count_ge_10
+        # accept if any integer-rounded value equals expected
+        ok = any(int(round(v)) == int(count_ge_10) for v in vals)
+        result['accuracy'] = ok
+        if not ok:
+            result['error_type'] = 'incorrect_offensive_depth'
+            result['notes'].append(
+                f"Expected {count_ge_10}, found: {vals}")
+
+    def _validate_strategic_analysis(self, result: Dict[str, Any], llm_response: str,
+                                     response_lower: str, numbers: Callable[[], _Numbers]):
+        """Free-form strategy answer must score >= 3 on every rubric axis"""
+        # rubric-based evaluation
+        scores = self._score_strategic_response(llm_response)
+        result['expected_answer'] = 'Rubric-based (Specificity, Actionability, Plausibility >= 3)'
+        result['notes'].append(f"Scores: {scores}")
+        result['accuracy'] = (scores['specificity'] >= 3 and
+                              scores['actionability'] >= 3 and
+                              scores['plausibility'] >= 3)
+        if not result['accuracy']:
+            result['error_type'] = 'insufficient_rubric_scores'
+    # ------------------------------------------------
 
     def print_ground_truth(self):
         """Print the correct answers for validation"""
-        print("=== SYRACUSE 2024 VALIDATION ANSWERS ===")
-        print(f"Season Record: {self.ground_truth['season_record']}")
-        print(f"Total Games: {self.ground_truth['total_games']}")
-        print(
-            f"Top Scorer: {self.ground_truth['top_scorer']} ({self.ground_truth['top_scorer_goals']} goals)")
-        print(
-            f"Top Assists: {self.ground_truth['top_assist']} ({self.ground_truth['top_assist_count']} assists)")
-        print(f"Total Team Goals: {self.ground_truth['total_goals']}")
-        print(f"Total Team Assists: {self.ground_truth['total_assists']}")
-        print(
-            f"Best Shooter: {self.ground_truth.get('best_shooter', 'N/A')} ({self.ground_truth.get('best_shooting_pct', 0):.1f}%)")
-        print(
-            f"Active Scorers (5+ goals): {self.ground_truth['active_scorers']}")
-        # Part 2 ground truth
-        print("Top-3 Shooting %:", self.ground_truth['top3_shooting'])
-        print("Players with ≥10 goals:",
-              self.ground_truth['count_ge_10_goals'])
+        gt = self.ground_truth
+        print("\n".join([
+            "=== SYRACUSE 2024 VALIDATION ANSWERS ===",
+            f"Season Record: {gt['season_record']}",
+            f"Total Games: {gt['total_games']}",
+            f"Top Scorer: {gt['top_scorer']} ({gt['top_scorer_goals']} goals)",
+            f"Top Assists: {gt['top_assist']} ({gt['top_assist_count']} assists)",
+            f"Total Team Goals: {gt['total_goals']}",
+            f"Total Team Assists: {gt['total_assists']}",
+            f"Best Shooter: {gt.get('best_shooter', 'N/A')} ({gt.get('best_shooting_pct', 0):.1f}%)",
+            f"Active Scorers (5+ goals): {gt['active_scorers']}",
+            # Part 2 ground truth
+            f"Top-3 Shooting %: {gt['top3_shooting']}",
+            f"Players with ≥10 goals: {gt['count_ge_10_goals']}",
+        ]))
 
 
 def generate_syracuse_test_prompts(validator: SyracuseDataValidator) -> List[Dict[str, str]]:
@@ -524,6 +660,35 @@ def generate_syracuse_test_prompts(validator: SyracuseDataValidator) -> List[Dic
     return prompts
 
 
+# Interactive text is constant, so it is built once and written in one call
+_MENU = "\n".join([
+    "",
+    "=" * 60,
+    "SYRACUSE TESTING MENU:",
+    "1. Show test prompt",
+    "2. Validate LLM response",
+    "3. Show all prompts",
+    "4. Generate summary report",
+    "5. Export data context for LLM",
+    "6. Exit",
+    "",
+])
+
+_QUESTION_TYPES_HELP = "\n".join([
+    "",
+    "Question types available:",
+    "- season_record",
+    "- total_games",
+    "- top_scorer",
+    "- team_goals",
+    "- top_assists",
+    "- shooting_analysis",
+    "- offensive_balance",
+    "- strategic_analysis",
+    "",
+])
+
+
 def run_syracuse_testing():
     """Interactive testing session with Syracuse data"""
 
@@ -542,14 +707,7 @@ def run_syracuse_testing():
     print(f"\n=== {len(test_prompts)} TEST PROMPTS GENERATED ===")
 
     while True:
-        print("\n" + "="*60)
-        print("SYRACUSE TESTING MENU:")
-        print("1. Show test prompt")
-        print("2. Validate LLM response")
-        print("3. Show all prompts")
-        print("4. Generate summary report")
-        print("5. Export data context for LLM")
-        print("6. Exit")
+        sys.stdout.write(_MENU)
 
         choice = input("\nEnter choice (1-6): ").strip()
 
@@ -609,15 +767,7 @@ def show_all_prompts(prompts):
 
 def validate_llm_response(validator, analyzer):
     """Validate an LLM response"""
-    print("\nQuestion types available:")
-    print("- season_record")
-    print("- total_games")
-    print("- top_scorer")
-    print("- team_goals")
-    print("- top_assists")
-    print("- shooting_analysis")
-    print("- offensive_balance")
-    print("- strategic_analysis")
+    sys.stdout.write(_QUESTION_TYPES_HELP)
 
     question_type = input("Enter question type: ").strip()
     llm_response = input("Paste LLM response here: ").strip()